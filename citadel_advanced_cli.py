@@ -3,53 +3,358 @@
 Citadel-Agent - Autonomous Secure Workflow Engine
 Advanced CLI Interface with Rich Terminal Display
 """
-import getpass
+import codecs
+import contextlib
+import functools
+import hmac
+import os
+import secrets
 import sys
 import time
-from datetime import datetime
+from enum import Enum
 from typing import Dict, List
-import uuid
-
-# Try to import rich for better terminal display
-try:
-    from rich.console import Console
-    from rich.panel import Panel
-    from rich.table import Table
-    from rich.progress import Progress, SpinnerColumn, TextColumn
-    from rich.prompt import Prompt
-    from rich.text import Text
-    HAS_RICH = True
-except ImportError:
-    HAS_RICH = False
-    # Fallback to basic printing
-    print("Rich library not found. Please install with: pip install rich")
-    import subprocess
-    import sys
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "rich"])
-    from rich.console import Console
-    from rich.panel import Panel
-    from rich.table import Table
-    from rich.progress import Progress, SpinnerColumn, TextColumn
-    from rich.prompt import Prompt
-    from rich.text import Text
-
-console = Console()
+
+# Rich is imported by _lazy_rich() on first use so importing this module stays cheap
+console = None
+Panel = Table = Prompt = Text = Group = Layout = Live = None
+
+# Glyphs the dashboard renders on every redraw besides plain ASCII
+_HOT_GLYPHS = "█░─│┌┐└┘╔╗╚╝═║🟢🟡🔴🔵"
+
+
+def _install_cell_size_cache():
+    """Serve Rich's per-character width lookups from a precomputed table"""
+    from rich import cells as rich_cells
+    from rich import segment as rich_segment
+
+    original = rich_cells.get_character_cell_size
+    widths = {ch: original(ch) for ch in map(chr, range(0x20, 0x7F))}
+    widths.update((ch, original(ch)) for ch in _HOT_GLYPHS)
+
+    def get_character_cell_size(character, unicode_version="auto"):
+        # The precomputed table only holds widths for the default unicode version
+        # Rich already lru_caches the original, so misses go straight to it
+        if unicode_version == "auto":
+            width = widths.get(character)
+            return original(character) if width is None else width
+        return original(character, unicode_version)
+
+    # Segment binds the function at import time, so patch both references
+    rich_cells.get_character_cell_size = get_character_cell_size
+    rich_segment.get_character_cell_size = get_character_cell_size
+
+
+def _lazy_rich():
+    """Import Rich and create the shared console on first use"""
+    global console, Panel, Table, Prompt, Text, Group, Layout, Live
+    if console is not None:
+        return
+
+    try:
+        from rich.console import Console, Group
+        from rich.layout import Layout
+        from rich.live import Live
+        from rich.panel import Panel
+        from rich.table import Table
+        from rich.prompt import Prompt
+        from rich.text import Text
+    except ImportError:
+        sys.exit("Rich library not found. Please install with: pip install rich")
+
+    _install_cell_size_cache()
+    if sys.stdout.isatty():
+        # Known interactive terminal, skip Rich's capability probing
+        console = Console(force_terminal=True, color_system="truecolor")
+    else:
+        console = Console()
+
+
+# Use environment variables or default values (in real system, this would connect to auth service)
+_ADMIN_USER = os.getenv("ADMIN_USERNAME", "admin").lower().encode()
+_ADMIN_PASS = os.getenv("ADMIN_PASSWORD", "citadel").encode()
+
+# Dashboard keys that act immediately, mapped to their console command
+_KEY_COMMANDS = {
+    '\r': '',
+    '\n': '',
+    '\x1b': 'esc',
+    '\x04': 'exit',  # Ctrl+D is an ordinary byte in cbreak mode
+    '1': 'workflow',
+    '2': 'monitor',
+    '3': 'workflow',
+    '4': 'security',
+    '5': 'nodes',
+    '6': 'monitor',
+    '7': 'settings',
+    '8': 'security',
+    '9': 'settings',
+}
+
+
+@contextlib.contextmanager
+def _cbreak():
+    """Put the terminal in cbreak mode so _getch() can read single keypresses"""
+    if os.name == 'nt':
+        # msvcrt reads keypresses directly, no mode switch needed
+        yield
+        return
+
+    import termios
+    import tty
+    fd = sys.stdin.fileno()
+    old_attrs = termios.tcgetattr(fd)
+    try:
+        # cbreak rather than raw so Ctrl+C still raises KeyboardInterrupt;
+        # TCSANOW keeps keys typed ahead instead of flushing them
+        tty.setcbreak(fd, termios.TCSANOW)
+        yield
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_attrs)
+
+
+def _getch():
+    """Read a single keypress without waiting for ENTER; call inside _cbreak()
+
+    Arrow and function keys come back as their whole escape sequence so a bare
+    ESC can be told apart from them, and '' means stdin reached EOF.
+    """
+    if os.name == 'nt':
+        import msvcrt
+        key = msvcrt.getwch()
+        if key in ('\x00', '\xe0'):
+            # Special keys arrive as a prefix plus a scan code
+            key += msvcrt.getwch()
+        return key
+
+    fd = sys.stdin.fileno()
+    key = os.read(fd, 1)
+    if key == b'\x1b':
+        import select
+        # Whatever follows ESC within a few milliseconds belongs to the same key
+        while select.select([fd], [], [], 0.03)[0]:
+            key += os.read(fd, 32)
+        return key.decode(errors="replace")
+
+    # Keep reading until the bytes form a whole UTF-8 character
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    char = decoder.decode(key)
+    while key and not char:
+        key = os.read(fd, 1)
+        char = decoder.decode(key, final=not key)
+    return char
+
+
+def _key_ready(timeout):
+    """Wait up to timeout seconds for a keypress; call inside _cbreak()"""
+    if os.name == 'nt':
+        import msvcrt
+        deadline = time.monotonic() + timeout
+        while not msvcrt.kbhit():
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.02)
+        return True
+
+    import select
+    return bool(select.select([sys.stdin.fileno()], [], [], timeout)[0])
+
+
+# Workflow status decorations
+_STATUS_SYMBOL = {
+    "RUNNING": "🟢",
+    "PAUSED": "🟡",
+    "FAILED": "🔴",
+    "QUEUED": "🔵"
+}
+_STATUS_COLOR = {
+    "RUNNING": "green",
+    "PAUSED": "yellow",
+    "FAILED": "red",
+    "QUEUED": "blue"
+}
+
+# Progress bars indexed by percent // 5 (0-100% in 5% steps)
+_BAR20 = ["█" * i + "░" * (20 - i) for i in range(21)]
+
+
+@functools.lru_cache(maxsize=64)
+def _status_line(name, status, progress, _symbol=_STATUS_SYMBOL.get, _bars=_BAR20):
+    """Dashboard row for a workflow; rows repeat across redraws so they are memoized"""
+    # The lookup tables are bound as defaults so a cache miss only touches locals
+    return f"{_symbol(status, '⚪')} [bold]{name:<20}[/bold] {_bars[progress // 5]} {progress:>3}%"
+
+
+@functools.lru_cache(maxsize=64)
+def _status_cell(status):
+    """Colour-tagged status for the workflow management table"""
+    color = _STATUS_COLOR.get(status, "white")
+    return f"[{color}]{status}[/{color}]"
+
+
+_ASCII_ART = """
+███████╗██████╗ ███████╗███████╗███████╗██╗   ██╗██████╗ 
+██╔════╝██╔══██╗██╔════╝██╔════╝██╔════╝╚██╗ ██╔╝╚════██╗
+█████╗  ██████╔╝█████╗  █████╗  █████╗   ╚████╔╝  █████╔╝
+██╔══╝  ██╔══██╗██╔══╝  ██╔══╝  ██╔══╝    ╚██╔╝  ██╔═══╝ 
+███████╗██║  ██║███████╗███████╗███████╗   ██║   ███████╗
+╚══════╝╚═╝  ╚═╝╚══════╝╚══════╝╚══════╝   ╚═╝   ╚══════╝
+                                                        
+        """
+
+
+@functools.cache
+def _ascii_art_text():
+    """Styled ASCII art banner, built once and reused on every screen"""
+    return Text(_ASCII_ART, style="bold cyan")
+
+
+# Static screen content, hoisted out of the render methods
+_QUICK_ACTIONS = (
+    "[bold blue][1][/bold blue] Create Workflow    [bold blue][4][/bold blue] View Logs        [bold blue][7][/bold blue] Settings\n"
+    "[bold blue][2][/bold blue] Monitor Execs      [bold blue][5][/bold blue] Manage Nodes     [bold blue][8][/bold blue] Security\n"
+    "[bold blue][3][/bold blue] Schedule Task      [bold blue][6][/bold blue] System Status    [bold blue][9][/bold blue] Profile"
+)
+
+_DASHBOARD_HINT = "[yellow]Press [bold]:[/bold] for console access | [bold]ESC[/bold] for menu | [bold]H[/bold] for help[/yellow]"
+
+_DASHBOARD_HEADER = "[bold cyan]CITADEL-AGENT DASHBOARD[/bold cyan]\n[italic]Secure Automation Suite[/italic]"
+
+# The single %s is filled with the build timestamp on each visit
+_HELP_TEXT_TEMPLATE = """
+[b]CITADEL-AGENT HELP[/b]
+[i]Command Reference[/i]
+
+[u]AVAILABLE COMMANDS:[/u]
+  dashboard     - Return to main dashboard
+  workflow      - Manage workflows (create, run, monitor)
+  nodes         - View and manage nodes
+  monitor       - Monitor system performance
+  security      - View security status and logs
+  settings      - Modify user settings
+
+[u]QUICK ACCESS KEYS:[/u]
+  [b]H[/b]         - Show this help
+  [b]1-9[/b]       - Quick actions
+  [b]ESC[/b]       - Return to login
+  [b]:[/b]         - Access console
+
+[u]SYSTEM INFORMATION:[/u]
+  Version: 0.1.0
+  Engine: Foundation-Core v0.1.0
+  Build: %s
+        """
+
+_AUDIT_TRAIL = """
+[b]AUDIT TRAIL:[/b]
+[15:32:47] User admin@citadel logged in from 10.0.0.42
+[15:31:22] Workflow "Data Sync Pipeline" started execution
+[15:30:15] Node "HTTP Request" completed successfully
+[15:29:08] Security scan on node "Data Processor" PASSED
+[15:28:55] Scheduled backup initiated for workflow data
+        """
+
+
+# Static panels pre-render their markup so reuse skips the markup parser
+
+@functools.cache
+def _quick_actions_panel():
+    """Static quick actions panel shown on the dashboard"""
+    return Panel(console.render_str(_QUICK_ACTIONS), title="Quick Actions", border_style="cyan")
+
+
+@functools.cache
+def _dashboard_header_panel():
+    """Static header panel shown above the dashboard"""
+    return Panel(
+        console.render_str(_DASHBOARD_HEADER),
+        title="[bold yellow]OPERATIONAL DASHBOARD[/bold yellow]",
+        border_style="green",
+        expand=False
+    )
+
+
+@functools.cache
+def _dashboard_banner():
+    """ASCII art and header panel shown together above the live dashboard"""
+    return Group(_ascii_art_text(), _dashboard_header_panel())
+
+
+@functools.lru_cache(maxsize=8)
+def _banner_rows(width):
+    """Rows the dashboard banner takes at the given terminal width"""
+    return len(console.render_lines(_dashboard_banner(), console.options.update_width(width), pad=False))
+
+
+@functools.cache
+def _audit_panel():
+    """Static audit trail panel shown on the security dashboard"""
+    return Panel(console.render_str(_AUDIT_TRAIL), title="Recent Activity", border_style="blue")
+
+
+# Rebuilt on every change since it carries the current message and typed command
+def _dashboard_footer(message, command):
+    """Hint, last message and command line shown under the live dashboard"""
+    footer = Text.from_markup(_DASHBOARD_HINT)
+    footer.append(f"\n{message}\n", style="yellow")
+    footer.append("[CMD] ", style="cyan")
+    if command is not None:
+        footer.append(f":{command}")
+    return footer
+
+
+# Heights of the fixed live dashboard regions; the workflows region grows with its list
+_USER_ROWS = 6
+_METRICS_ROWS = 5
+_ACTIONS_ROWS = 5
+_FOOTER_ROWS = 3
+
+
+class Screen(Enum):
+    """Screens the CLI navigates between"""
+    LOGIN = "login"
+    DASHBOARD = "dashboard"
+    HELP = "help"
+    WORKFLOWS = "workflows"
+    NODES = "nodes"
+    MONITORING = "monitoring"
+    SECURITY = "security"
+    SETTINGS = "settings"
+    EXIT = "exit"
+
+
+# Console commands and the screen each one opens
+_COMMAND_SCREENS = {
+    'h': Screen.HELP,
+    'esc': Screen.LOGIN,
+    'quit': Screen.EXIT,
+    'exit': Screen.EXIT,
+    'q': Screen.EXIT,
+    'dashboard': Screen.DASHBOARD,
+    'workflow': Screen.WORKFLOWS,
+    'nodes': Screen.NODES,
+    'monitor': Screen.MONITORING,
+    'security': Screen.SECURITY,
+    'settings': Screen.SETTINGS,
+}
 
 
 class CitadelCLI:
     """Advanced Citadel-Agent CLI with Rich Terminal Display"""
     
     def __init__(self):
+        _lazy_rich()
+        # Cosmetic pauses only run in demo mode (CITADEL_DEMO=1)
+        self.demo_delays = os.getenv("CITADEL_DEMO") == "1"
         self.current_user = None
         self.session_active = False
-        self.session_id = str(uuid.uuid4())[:8].upper()
+        self.session_id = secrets.token_hex(4).upper()
         self.system_status = "SECURE"
-        self.active_workflows = [
-            {"id": "1", "name": "Data Sync Pipeline", "status": "RUNNING", "progress": 100},
-            {"id": "2", "name": "Report Generator", "status": "PAUSED", "progress": 25},
-            {"id": "3", "name": "API Monitor", "status": "FAILED", "progress": 8},
-            {"id": "4", "name": "Email Campaign", "status": "QUEUED", "progress": 0}
-        ]
+        self.state = Screen.LOGIN
+        # Active workflows as parallel arrays, one entry per workflow
+        self.wf_ids = ["1", "2", "3", "4"]
+        self.wf_names = ["Data Sync Pipeline", "Report Generator", "API Monitor", "Email Campaign"]
+        self.wf_statuses = ["RUNNING", "PAUSED", "FAILED", "QUEUED"]
+        self.wf_progress = [100, 25, 8, 0]
         self.system_metrics = {
             'cpu': 78,
             'ram': 62,
@@ -59,22 +364,85 @@ class CitadelCLI:
             'security': 'ACTIVE',
             'sandbox': 'ACTIVE'
         }
+        # Rendered dashboard panels, rebuilt only when their state is marked dirty
+        self._dashboard_cache = {}
+        self._dashboard_dirty = {'user', 'workflows', 'metrics'}
+        self._layout = None
+    
+    def _delay(self, seconds):
+        """Pause for cosmetic effect when demo delays are enabled"""
+        if self.demo_delays:
+            time.sleep(seconds)
+    
+    def mark_dashboard_dirty(self, *panels):
+        """Flag dashboard panels ('user', 'workflows', 'metrics') for rebuild"""
+        self._dashboard_dirty.update(panels)
+    
+    def _build_user_panel(self):
+        """Build the user session panel"""
+        user_table = Table.grid(expand=True)
+        user_table.add_column(style="bold white", ratio=1)
+        user_table.add_row(f"USER: [green]{self.current_user}@citadel-corp[/green]")
+        user_table.add_row(f"ROLE: [green]Automation Engineer[/green]")
+        user_table.add_row(f"SESSION: [green]SECURE-OPS-{self.session_id}[/green]")
+        user_table.add_row(f"STATUS: [green]Active | Last Activity: 0s ago[/green]")
+        
+        return Panel(user_table, title="User Session", border_style="magenta")
+    
+    def _build_workflows_panel(self):
+        """Build the active workflows panel"""
+        wf_table = Table.grid(expand=True)
+        wf_table.add_column(style="white", ratio=1)
+        
+        names, statuses, percents = self.wf_names, self.wf_statuses, self.wf_progress
+        for i in range(len(self.wf_ids)):
+            wf_table.add_row(_status_line(names[i], statuses[i], percents[i]))
+        
+        return Panel(wf_table, title="Active Workflows", border_style="blue")
+    
+    def _build_metrics_panel(self):
+        """Build the system metrics panel"""
+        metrics_table = Table.grid(expand=True)
+        metrics_table.add_column(style="white", ratio=1)
+        
+        # CPU and RAM bars
+        cpu_bar = _BAR20[self.system_metrics['cpu'] // 5]
+        ram_bar = _BAR20[self.system_metrics['ram'] // 5]
+        
+        metrics_table.add_row(f"CPU: {cpu_bar} {self.system_metrics['cpu']:>2}% | RAM: {ram_bar} {self.system_metrics['ram']:>2}%")
+        metrics_table.add_row(f"Nodes: {self.system_metrics['nodes']} Active | Sessions: {self.system_metrics['sessions']} | Queued: {self.system_metrics['queued']}")
+        
+        # Security status
+        sec_symbol = "✓" if self.system_metrics['security'] == 'ACTIVE' else "✗"
+        sbx_symbol = "✓" if self.system_metrics['sandbox'] == 'ACTIVE' else "✗"
+        metrics_table.add_row(f"Security: [{sec_symbol}] Active | Sandboxed: [{sbx_symbol}] Active")
+        
+        return Panel(metrics_table, title="System Metrics", border_style="yellow")
+    
+    def _dashboard_panels(self):
+        """Return (user, workflows, metrics, actions) panels, rebuilding only dirty ones"""
+        builders = {
+            'user': self._build_user_panel,
+            'workflows': self._build_workflows_panel,
+            'metrics': self._build_metrics_panel,
+        }
+        for name in self._dashboard_dirty:
+            self._dashboard_cache[name] = builders[name]()
+        self._dashboard_dirty.clear()
+        
+        return (
+            self._dashboard_cache['user'],
+            self._dashboard_cache['workflows'],
+            self._dashboard_cache['metrics'],
+            _quick_actions_panel(),
+        )
     
     def draw_ascii_art(self):
         """Draw Citadel-Agent ASCII art"""
-        art = """
-███████╗██████╗ ███████╗███████╗███████╗██╗   ██╗██████╗ 
-██╔════╝██╔══██╗██╔════╝██╔════╝██╔════╝╚██╗ ██╔╝╚════██╗
-█████╗  ██████╔╝█████╗  █████╗  █████╗   ╚████╔╝  █████╔╝
-██╔══╝  ██╔══██╗██╔══╝  ██╔══╝  ██╔══╝    ╚██╔╝  ██╔═══╝ 
-███████╗██║  ██║███████╗███████╗███████╗   ██║   ███████╗
-╚══════╝╚═╝  ╚═╝╚══════╝╚══════╝╚══════╝   ╚═╝   ╚══════╝
-                                                        
-        """
-        console.print(art, style="bold cyan")
+        console.print(_ascii_art_text())
     
     def show_login_screen(self):
-        """Display the login screen with Rich formatting"""
+        """Display the login screen with Rich formatting and return the next screen"""
         console.clear()
         
         # Show ASCII art
@@ -92,7 +460,7 @@ class CitadelCLI:
         
         # Simulate secure channel initialization
         with console.status("[bold green]Initializing secure channel...", spinner="clock"):
-            time.sleep(0.5)
+            self._delay(0.5)
         
         console.print("\n[yellow]STATUS:[/yellow] Secure channel initialized")
         console.print("[yellow]ENGINE:[/yellow] Foundation-Core v0.1.0")
@@ -104,211 +472,242 @@ class CitadelCLI:
         console.print("  • System uses sandbox & policy isolation.\n")
         
         # Get credentials
+        import getpass
         username = Prompt.ask("[green]> Username[/green]")
         password = getpass.getpass("[green]> Password[/green]: ")
         
         # Simulate authentication
         with console.status("[cyan]Authenticating...", spinner="clock"):
-            time.sleep(1.5)  # Simulate network delay
+            self._delay(1.5)  # Simulate network delay
         
-        # Use environment variables or default values (in real system, this would connect to auth service)
-        admin_username = os.getenv("ADMIN_USERNAME", "admin")
-        admin_password = os.getenv("ADMIN_PASSWORD", "citadel")
+        # Compare both fields in constant time so timing reveals neither
+        user_ok = hmac.compare_digest(username.lower().encode(), _ADMIN_USER)
+        pass_ok = hmac.compare_digest(password.encode(), _ADMIN_PASS)
 
-        if username.lower() == admin_username.lower() and password == admin_password:
+        if user_ok and pass_ok:
             console.print("\n[bold green]✓ Authentication successful![/bold green]")
             self.current_user = username
             self.session_active = True
-            time.sleep(1)
-            self.show_dashboard()
+            self.mark_dashboard_dirty('user')
+            self._delay(1)
+            return Screen.DASHBOARD
         else:
             console.print("\n[bold red]✗ Authentication failed![/bold red]")
             console.print("[yellow]Press ENTER to try again...[/yellow]")
             input()
-            self.show_login_screen()
+            return Screen.LOGIN
     
     def show_dashboard(self):
-        """Display the main dashboard"""
-        console.clear()
-        
-        # Show dashboard header
-        self.draw_ascii_art()
-        console.print(Panel(
-            "[bold cyan]CITADEL-AGENT DASHBOARD[/bold cyan]\n[italic]Secure Automation Suite[/italic]",
-            title="[bold yellow]OPERATIONAL DASHBOARD[/bold yellow]",
-            border_style="green",
-            expand=False
-        ))
-        
-        # Create user info table
-        user_table = Table.grid(expand=True)
-        user_table.add_column(style="bold white", ratio=1)
-        user_table.add_row(f"USER: [green]{self.current_user}@citadel-corp[/green]")
-        user_table.add_row(f"ROLE: [green]Automation Engineer[/green]")
-        user_table.add_row(f"SESSION: [green]SECURE-OPS-{self.session_id}[/green]")
-        user_table.add_row(f"STATUS: [green]Active | Last Activity: 0s ago[/green]")
-        
-        console.print(Panel(user_table, title="User Session", border_style="magenta"))
-        
-        # Active Workflows Panel
-        wf_table = Table.grid(expand=True)
-        wf_table.add_column(style="white", ratio=1)
-        
-        for wf in self.active_workflows:
-            status_symbol = {
-                "RUNNING": "🟢",
-                "PAUSED": "🟡", 
-                "FAILED": "🔴",
-                "QUEUED": "🔵"
-            }.get(wf['status'], "⚪")
+        """Display the main dashboard and return the screen selected from the console"""
+        try:
+            # Terminals too short for the panels plus the command line get the printed view
+            if console.is_terminal and sys.stdin.isatty() and console.height >= self._live_min_height():
+                next_screen = self._live_dashboard()
+            else:
+                next_screen = self._printed_dashboard()
+        except KeyboardInterrupt:
+            # Ctrl+C leaves the dashboard; Live has restored the screen by now
+            console.print("\n[red]Received interrupt.[/red]")
+            next_screen = Screen.EXIT
+        
+        if next_screen is Screen.LOGIN:
+            console.print("[yellow]Returning to login screen...[/yellow]")
+            self._delay(1)
+        elif next_screen is Screen.EXIT:
+            console.print("[red]Shutting down Citadel Agent...[/red]")
+        return next_screen
+    
+    def _printed_dashboard(self):
+        """Print the dashboard once and read line commands until one selects a screen"""
+        # Render the whole screen into one buffer and emit it with a single write
+        with console.capture() as capture:
+            console.clear()
             
-            # Create progress bar
-            progress = "█" * int(wf['progress']/5) + "░" * (20 - int(wf['progress']/5))
-            status_line = f"{status_symbol} [bold]{wf['name']:<20}[/bold] {progress} {wf['progress']:>3}%"
-            wf_table.add_row(status_line)
-        
-        console.print(Panel(wf_table, title="Active Workflows", border_style="blue"))
-        
-        # System Metrics
-        metrics_table = Table.grid(expand=True)
-        metrics_table.add_column(style="white", ratio=1)
-        
-        # CPU and RAM bars
-        cpu_bar = "█" * int(self.system_metrics['cpu']/5) + "░" * (20 - int(self.system_metrics['cpu']/5))
-        ram_bar = "█" * int(self.system_metrics['ram']/5) + "░" * (20 - int(self.system_metrics['ram']/5))
-        
-        metrics_table.add_row(f"CPU: {cpu_bar} {self.system_metrics['cpu']:>2}% | RAM: {ram_bar} {self.system_metrics['ram']:>2}%")
-        metrics_table.add_row(f"Nodes: {self.system_metrics['nodes']} Active | Sessions: {self.system_metrics['sessions']} | Queued: {self.system_metrics['queued']}")
-        
-        # Security status
-        sec_symbol = "✓" if self.system_metrics['security'] == 'ACTIVE' else "✗"
-        sbx_symbol = "✓" if self.system_metrics['sandbox'] == 'ACTIVE' else "✗"
-        metrics_table.add_row(f"Security: [{sec_symbol}] Active | Sandboxed: [{sbx_symbol}] Active")
-        
-        console.print(Panel(metrics_table, title="System Metrics", border_style="yellow"))
-        
-        # Quick Actions
-        actions_panel = Panel(
-            "[bold blue][1][/bold blue] Create Workflow    [bold blue][4][/bold blue] View Logs        [bold blue][7][/bold blue] Settings\n"
-            "[bold blue][2][/bold blue] Monitor Execs      [bold blue][5][/bold blue] Manage Nodes     [bold blue][8][/bold blue] Security\n"
-            "[bold blue][3][/bold blue] Schedule Task      [bold blue][6][/bold blue] System Status    [bold blue][9][/bold blue] Profile",
-            title="Quick Actions",
-            border_style="cyan"
-        )
-        console.print(actions_panel)
-        
-        console.print("\n[yellow]Press [bold]CMD[/bold] for console access | [bold]ESC[/bold] for menu | [bold]H[/bold] for help[/yellow]")
+            # Show dashboard header
+            self.draw_ascii_art()
+            console.print(_dashboard_header_panel())
+            
+            for panel in self._dashboard_panels():
+                console.print(panel)
+            
+            console.print(f"\n{_DASHBOARD_HINT}")
+        sys.stdout.write(capture.get())
+        sys.stdout.flush()
         
         # Handle command input
         while True:
-            try:
-                cmd_input = Prompt.ask("\n[cyan][CMD][/cyan]", default="")
+            cmd_input = self._read_command()
+            next_screen = _COMMAND_SCREENS.get(cmd_input.lower())
+            if next_screen is not None:
+                return next_screen
+            console.print(f"[yellow]Command '{cmd_input}' not recognized. Press 'H' for help.[/yellow]")
+    
+    def _live_dashboard(self):
+        """Serve the dashboard from a Live layout, repainting only when a region changes"""
+        layout = self._dashboard_layout()
+        message = ""
+        command = None  # Text typed after ':', or None in single-key mode
+        shown_footer = None
+        shown_size = None
+        
+        with _cbreak(), Live(layout, console=console, screen=True, auto_refresh=False) as live:
+            while True:
+                size = console.size
+                if size.height < self._live_min_height():
+                    # Shrunk below the live layout; show_dashboard picks the printed view
+                    return Screen.DASHBOARD
+                changed = self._update_dashboard_layout(layout)
+                if (message, command) != shown_footer:
+                    shown_footer = (message, command)
+                    layout["footer"].update(_dashboard_footer(message, command))
+                    changed = True
+                if changed or size != shown_size:
+                    shown_size = size
+                    live.refresh()
                 
-                if cmd_input.lower() == 'h':
-                    self.show_help()
-                elif cmd_input.lower() == 'esc':
-                    console.print("[yellow]Returning to login screen...[/yellow]")
-                    time.sleep(1)
-                    self.show_login_screen()
-                elif cmd_input.lower() in ['quit', 'exit', 'q']:
-                    console.print("[red]Shutting down Citadel Agent...[/red]")
-                    sys.exit(0)
-                elif cmd_input.lower() == 'dashboard':
-                    self.show_dashboard()
-                elif cmd_input.lower() == 'workflow':
-                    self.manage_workflows()
-                elif cmd_input.lower() == 'nodes':
-                    self.manage_nodes()
-                elif cmd_input.lower() == 'monitor':
-                    self.show_monitoring()
-                elif cmd_input.lower() == 'security':
-                    self.show_security()
-                elif cmd_input.lower() == 'settings':
-                    self.show_settings()
+                # Poll rather than block so a terminal resize repaints without a keypress
+                if not _key_ready(0.25):
+                    continue
+                key = _getch()
+                if not key:
+                    return Screen.EXIT
+                if len(key) > 1:
+                    # Arrow and function keys have no dashboard binding
+                    continue
+                if command is None:
+                    if key == ':':
+                        command = ""
+                        continue
+                    cmd_input = _KEY_COMMANDS.get(key, key)
+                elif key in ('\r', '\n'):
+                    cmd_input, command = command, None
+                elif key == '\x1b':
+                    command = None
+                    continue
                 else:
-                    console.print(f"[yellow]Command '{cmd_input}' not recognized. Press 'H' for help.[/yellow]")
-            except KeyboardInterrupt:
-                console.print("\n[red]Received interrupt. Returning to dashboard...[/red]")
-                break
+                    if key in ('\x7f', '\b'):
+                        command = command[:-1]
+                    elif key.isprintable():
+                        command += key
+                    continue
+                
+                next_screen = _COMMAND_SCREENS.get(cmd_input.lower())
+                if next_screen is not None:
+                    return next_screen
+                message = f"Command '{cmd_input}' not recognized. Press 'H' for help."
+    
+    def _dashboard_layout(self):
+        """Build the dashboard Layout once; region contents are swapped in as they change"""
+        if self._layout is None:
+            self._layout = Layout()
+            # The banner takes whatever height is left; it is hidden when it would not fit whole
+            self._layout.split_column(
+                Layout(_dashboard_banner(), name="header", minimum_size=0),
+                Layout(name="user", size=_USER_ROWS),
+                Layout(name="workflows"),
+                Layout(name="metrics", size=_METRICS_ROWS),
+                Layout(_quick_actions_panel(), name="actions", size=_ACTIONS_ROWS),
+                Layout(name="footer", size=_FOOTER_ROWS),
+            )
+        return self._layout
+    
+    def _live_min_height(self):
+        """Rows the live dashboard needs for its panels and a full footer"""
+        return _USER_ROWS + len(self.wf_ids) + 2 + _METRICS_ROWS + _FOOTER_ROWS
+    
+    def _update_dashboard_layout(self, layout):
+        """Swap freshly rebuilt panels into their regions and report whether any changed"""
+        user, workflows, metrics, _ = self._dashboard_panels()
+        layout["workflows"].size = len(self.wf_ids) + 2
+        
+        changed = False
+        # Drop the banner, then the quick actions, before the footer is squeezed;
+        # the hint still names the keys
+        spare = console.height - self._live_min_height()
+        show_actions = spare >= _ACTIONS_ROWS
+        show_header = show_actions and spare - _ACTIONS_ROWS >= _banner_rows(console.width)
+        for name, visible in (("header", show_header), ("actions", show_actions)):
+            if layout[name].visible != visible:
+                layout[name].visible = visible
+                changed = True
+        for name, panel in (("user", user), ("workflows", workflows), ("metrics", metrics)):
+            if layout[name].renderable is not panel:
+                layout[name].update(panel)
+                changed = True
+        return changed
+    
+    def _read_command(self):
+        """Read a dashboard command; single keys act at once, ':' opens the console prompt"""
+        if not sys.stdin.isatty():
+            return Prompt.ask("\n[cyan][CMD][/cyan]", default="")
+        
+        console.print("\n[cyan][CMD][/cyan] ", end="")
+        with _cbreak():
+            key = _getch()
+        if not key:
+            return 'exit'
+        if key == ':':
+            return console.input(":")
+        
+        console.print(key if key.isprintable() else "")
+        if len(key) > 1:
+            # Arrow and function keys have no dashboard binding
+            return ''
+        return _KEY_COMMANDS.get(key, key)
     
     def show_help(self):
         """Show help information"""
+        from datetime import datetime
         console.clear()
         
-        help_text = """
-[b]CITADEL-AGENT HELP[/b]
-[i]Command Reference[/i]
-
-[u]AVAILABLE COMMANDS:[/u]
-  dashboard     - Return to main dashboard
-  workflow      - Manage workflows (create, run, monitor)
-  nodes         - View and manage nodes
-  monitor       - Monitor system performance
-  security      - View security status and logs
-  settings      - Modify user settings
-
-[u]QUICK ACCESS KEYS:[/u]
-  [b]H[/b]         - Show this help
-  [b]ESC[/b]       - Return to login
-  [b]CMD[/b]       - Access console
-
-[u]SYSTEM INFORMATION:[/u]
-  Version: 0.1.0
-  Engine: Foundation-Core v0.1.0
-  Build: {}
-        """.format(datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+        help_text = _HELP_TEXT_TEMPLATE % datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         
         console.print(Panel(help_text, title="Help Information", border_style="green"))
         input("\nPress ENTER to return to dashboard...")
-        self.show_dashboard()
+        return Screen.DASHBOARD
     
     def manage_workflows(self):
         """Manage workflows interface"""
-        console.clear()
-        console.print(Panel("[bold blue]WORKFLOW MANAGEMENT[/bold blue]", title="Workflows"))
-        
-        # Show existing workflows
-        table = Table(title="Active Workflows")
-        table.add_column("ID", style="cyan", no_wrap=True)
-        table.add_column("Name", style="magenta")
-        table.add_column("Status", style="green")
-        table.add_column("Progress", justify="right", style="yellow")
-        
-        for wf in self.active_workflows:
-            status_color = {
-                "RUNNING": "green",
-                "PAUSED": "yellow", 
-                "FAILED": "red",
-                "QUEUED": "blue"
-            }.get(wf['status'], "white")
+        # Stay on this screen until the operator leaves it
+        while True:
+            console.clear()
+            console.print(Panel("[bold blue]WORKFLOW MANAGEMENT[/bold blue]", title="Workflows"))
+            
+            # Show existing workflows
+            table = Table(title="Active Workflows")
+            table.add_column("ID", style="cyan", no_wrap=True)
+            table.add_column("Name", style="magenta")
+            table.add_column("Status", style="green")
+            table.add_column("Progress", justify="right", style="yellow")
+            
+            for i in range(len(self.wf_ids)):
+                table.add_row(
+                    self.wf_ids[i],
+                    self.wf_names[i],
+                    _status_cell(self.wf_statuses[i]),
+                    f"{self.wf_progress[i]}%"
+                )
+            
+            console.print(table)
+            
+            console.print("\n[bold]Actions:[/bold]")
+            console.print("  [1] Create new workflow")
+            console.print("  [2] Run workflow")
+            console.print("  [3] Pause workflow")
+            console.print("  [4] Delete workflow")
+            console.print("  [B] Back to dashboard")
+            
+            choice = Prompt.ask("\nSelect option", choices=['1', '2', '3', '4', 'B'], default='B')
+            
+            if choice != '1':
+                # Back, or an action that is not implemented yet
+                return Screen.DASHBOARD
             
-            table.add_row(
-                wf['id'],
-                wf['name'],
-                f"[{status_color}]{wf['status']}[/{status_color}]",
-                f"{wf['progress']}%"
-            )
-        
-        console.print(table)
-        
-        console.print("\n[bold]Actions:[/bold]")
-        console.print("  [1] Create new workflow")
-        console.print("  [2] Run workflow")
-        console.print("  [3] Pause workflow")
-        console.print("  [4] Delete workflow")
-        console.print("  [B] Back to dashboard")
-        
-        choice = Prompt.ask("\nSelect option", choices=['1', '2', '3', '4', 'B'], default='B')
-        
-        if choice == 'B':
-            self.show_dashboard()
-        elif choice == '1':
             # Simulate creating new workflow
             with console.status("[cyan]Creating new workflow...", spinner="clock"):
-                time.sleep(1)
+                self._delay(1)
             console.print("[green]✓ New workflow created![/green]")
             input("Press ENTER to continue...")
-            self.manage_workflows()
     
     def manage_nodes(self):
         """Node management interface"""
@@ -317,7 +716,7 @@ class CitadelCLI:
         
         console.print("\n[i]Node management interface coming soon...[/i]")
         input("\nPress ENTER to return to dashboard...")
-        self.show_dashboard()
+        return Screen.DASHBOARD
     
     def show_monitoring(self):
         """System monitoring interface"""
@@ -326,7 +725,7 @@ class CitadelCLI:
         
         console.print("\n[i]System monitoring interface coming soon...[/i]")
         input("\nPress ENTER to return to dashboard...")
-        self.show_dashboard()
+        return Screen.DASHBOARD
     
     def show_security(self):
         """Security dashboard interface"""
@@ -343,19 +742,10 @@ class CitadelCLI:
         console.print(Panel(sec_table, title="Security Status", border_style="red"))
         
         # Audit trail
-        audit_panel = Panel("""
-[b]AUDIT TRAIL:[/b]
-[15:32:47] User admin@citadel logged in from 10.0.0.42
-[15:31:22] Workflow "Data Sync Pipeline" started execution
-[15:30:15] Node "HTTP Request" completed successfully
-[15:29:08] Security scan on node "Data Processor" PASSED
-[15:28:55] Scheduled backup initiated for workflow data
-        """, title="Recent Activity", border_style="blue")
-        
-        console.print(audit_panel)
+        console.print(_audit_panel())
         
         input("\nPress ENTER to return to dashboard...")
-        self.show_dashboard()
+        return Screen.DASHBOARD
     
     def show_settings(self):
         """User settings interface"""
@@ -364,12 +754,24 @@ class CitadelCLI:
         
         console.print("\n[i]Settings interface coming soon...[/i]")
         input("\nPress ENTER to return to dashboard...")
-        self.show_dashboard()
+        return Screen.DASHBOARD
     
     def run(self):
         """Run the CLI application"""
+        handlers = {
+            Screen.LOGIN: self.show_login_screen,
+            Screen.DASHBOARD: self.show_dashboard,
+            Screen.HELP: self.show_help,
+            Screen.WORKFLOWS: self.manage_workflows,
+            Screen.NODES: self.manage_nodes,
+            Screen.MONITORING: self.show_monitoring,
+            Screen.SECURITY: self.show_security,
+            Screen.SETTINGS: self.show_settings,
+        }
         try:
-            self.show_login_screen()
+            # Each handler returns the next screen instead of calling it
+            while self.state is not Screen.EXIT:
+                self.state = handlers[self.state]()
         except KeyboardInterrupt:
             console.print("\n\n[red]Shutting down Citadel Agent...[/red]")
             sys.exit(0)
@@ -377,10 +779,15 @@ class CitadelCLI:
 
 def main():
     """Main entry point"""
-    console.print("[cyan]Starting Citadel-Agent v0.1.0...[/cyan]")
-    time.sleep(0.5)
+    # Piped output gets the plain terminal interface; Rich honours NO_COLOR by itself
+    if not sys.stdout.isatty():
+        from citadel_cli import CitadelTerminal
+        return CitadelTerminal().run()
     
     cli = CitadelCLI()
+    console.print("[cyan]Starting Citadel-Agent v0.1.0...[/cyan]")
+    cli._delay(0.5)
+    
     cli.run()
 
 
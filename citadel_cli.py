@@ -4,10 +4,12 @@ Citadel-Agent - Autonomous Secure Workflow Engine
 Interactive CLI Interface
 """
 import getpass
+import hmac
 import sys
 import time
 import os
 from datetime import datetime
+from enum import Enum
 from typing import Dict, List
 
 class TerminalStyle:
@@ -32,13 +34,109 @@ class TerminalStyle:
     BG_WHITE = '\033[47m'
 
 
+# Only a terminal gets escape codes; NO_COLOR (https://no-color.org) also drops the colours
+_TTY = sys.stdout.isatty()
+_PLAIN = bool(os.getenv("NO_COLOR")) or not _TTY
+
+# Module-level aliases keep the hot render paths on global lookups
+if _PLAIN:
+    _RESET = _BOLD = _RED = _GREEN = _YELLOW = _BLUE = _PURPLE = _CYAN = _WHITE = ""
+else:
+    _RESET = TerminalStyle.RESET
+    _BOLD = TerminalStyle.BOLD
+    _RED = TerminalStyle.RED
+    _GREEN = TerminalStyle.GREEN
+    _YELLOW = TerminalStyle.YELLOW
+    _BLUE = TerminalStyle.BLUE
+    _PURPLE = TerminalStyle.PURPLE
+    _CYAN = TerminalStyle.CYAN
+    _WHITE = TerminalStyle.WHITE
+
+# Pre-styled box edges repeated on every bordered line
+_GREEN_EDGE = f"{_GREEN}│{_RESET}"
+_YELLOW_EDGE = f"{_YELLOW}│{_RESET}"
+_BLUE_EDGE = f"{_BLUE}│{_RESET}"
+
+# Row templates for the dashboard boxes; callers ljust the content to the box width
+_USER_TOP = f"{_PURPLE}╔{'═' * 63}╗{_RESET}"
+_USER_ROW = f"{_PURPLE}║{_CYAN}{{}}{_PURPLE}║{_RESET}"
+_USER_BOTTOM = f"{_PURPLE}╚{'═' * 63}╝{_RESET}"
+_WORKFLOW_ROW = f"{_GREEN_EDGE} {{}} {_GREEN_EDGE}"
+_ACTION_ROW = f"{_YELLOW_EDGE} {{}} {_YELLOW_EDGE}"
+
+
+# Use environment variables or default values
+_ADMIN_USER = os.getenv("ADMIN_USERNAME", "admin").encode()
+_ADMIN_PASS = os.getenv("ADMIN_PASSWORD", "citadel").encode()
+
+# Erase display and move the cursor home; cheaper than spawning cls/clear
+_CLEAR_SCREEN = "\x1b[2J\x1b[H" if _TTY else ""
+
+if os.name == 'nt' and _TTY:
+    # An empty shell command makes the Windows console honour ANSI escapes
+    os.system('')
+
+# Metric bars indexed by percent // 10 (0-100% in 10% steps)
+_BAR10 = ["█" * i + "░" * (10 - i) for i in range(11)]
+
+# Quick actions box shown on the dashboard
+_QUICK_ACTIONS = (
+    "[1] Create Workflow  [4] View Logs      [7] Settings",
+    "[2] Monitor Execs    [5] Manage Nodes   [8] Security",
+    "[3] Schedule Task    [6] System Status  [9] Profile "
+)
+_QUICK_ACTION_LINES = (
+    f"{_YELLOW}┌─ QUICK ACTIONS ────────────────────────────────────────┐{_RESET}",
+    *(_ACTION_ROW.format(action.ljust(59)) for action in _QUICK_ACTIONS),
+    f"{_YELLOW}└─────────────────────────────────────────────────────────┘{_RESET}"
+)
+
+# The single %s is filled with the build timestamp on each visit
+_HELP_TEXT_TEMPLATE = "\n".join((
+    "",
+    f"{_BOLD}AVAILABLE COMMANDS:{_RESET}",
+    "",
+    "  dashboard     - Return to main dashboard",
+    "  workflow      - Manage workflows (create, run, monitor)",
+    "  nodes         - View and manage nodes",
+    "  monitor       - Monitor system performance",
+    "  security      - View security status and logs",
+    "  settings      - Modify user settings",
+    "",
+    f"{_BOLD}QUICK ACCESS KEYS:{_RESET}",
+    "",
+    "  [H]         - Show this help",
+    "  [ESC]       - Return to login",
+    "  [CMD]       - Access console",
+    "",
+    f"{_BOLD}SYSTEM INFORMATION:{_RESET}",
+    "",
+    "  Version: 0.1.0",
+    "  Engine: Foundation-Core v0.1.0",
+    "  Build: %s",
+    "",
+    "Press ENTER to return to dashboard..."
+))
+
+
+class Screen(Enum):
+    """Screens the terminal navigates between"""
+    LOGIN = "login"
+    DASHBOARD = "dashboard"
+    HELP = "help"
+    EXIT = "exit"
+
+
 class CitadelTerminal:
     """Main Citadel-Agent Terminal Interface"""
     
     def __init__(self):
+        # Cosmetic pauses only run in demo mode (CITADEL_DEMO=1)
+        self.demo_delays = os.getenv("CITADEL_DEMO") == "1"
         self.current_user = None
         self.session_active = False
         self.system_status = "SECURE"
+        self.state = Screen.LOGIN
         self.active_workflows = []
         self.system_metrics = {
             'cpu': 78,
@@ -48,85 +146,98 @@ class CitadelTerminal:
             'queued': 7
         }
     
+    def _delay(self, seconds):
+        """Pause for cosmetic effect when demo delays are enabled"""
+        if self.demo_delays:
+            time.sleep(seconds)
+    
     def clear_screen(self):
         """Clear the terminal screen"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        sys.stdout.write(_CLEAR_SCREEN)
+        sys.stdout.flush()
     
-    def print_separator(self, char='=', length=65, color=TerminalStyle.WHITE):
+    def print_separator(self, char='=', length=65, color=_WHITE):
         """Print a separator line"""
-        print(f"{color}{char * length}{TerminalStyle.RESET}")
+        print(f"{color}{char * length}{_RESET}")
+    
+    def header_lines(self, title, subtitle=None) -> List[str]:
+        """Build the lines of a formatted header"""
+        separator = f"{_WHITE}{'=' * 65}{_RESET}"
+        lines = [separator, f"{_CYAN}{_BOLD}{title:^65}{_RESET}"]
+        if subtitle:
+            lines.append(f"{_CYAN}{subtitle:^65}{_RESET}")
+        lines.append(separator)
+        return lines
     
     def print_header(self, title, subtitle=None):
         """Print a formatted header"""
-        self.print_separator('=', 65)
-        print(f"{TerminalStyle.CYAN}{TerminalStyle.BOLD}{title:^65}{TerminalStyle.RESET}")
-        if subtitle:
-            print(f"{TerminalStyle.CYAN}{subtitle:^65}{TerminalStyle.RESET}")
-        self.print_separator('=', 65)
+        print("\n".join(self.header_lines(title, subtitle)))
     
     def print_box(self, lines: List[str], border_char='│', outer_border=True):
         """Print a box with content"""
         if outer_border:
-            print(f"{TerminalStyle.YELLOW}┌{'─' * 63}┐{TerminalStyle.RESET}")
+            print(f"{_YELLOW}┌{'─' * 63}┐{_RESET}")
         
         for line in lines:
-            print(f"{TerminalStyle.YELLOW}{border_char}{TerminalStyle.RESET} {line:<61} {TerminalStyle.YELLOW}{border_char}{TerminalStyle.RESET}")
+            print(f"{_YELLOW}{border_char}{_RESET} {line:<61} {_YELLOW}{border_char}{_RESET}")
         
         if outer_border:
-            print(f"{TerminalStyle.YELLOW}└{'─' * 63}┘{TerminalStyle.RESET}")
+            print(f"{_YELLOW}└{'─' * 63}┘{_RESET}")
     
     def print_login_screen(self):
-        """Display the login screen"""
+        """Display the login screen and return the next screen"""
         self.clear_screen()
         self.print_header("CITADEL-AGENT", "Autonomous Secure Workflow Engine")
         
-        print(f"\n{TerminalStyle.RED}[ AUTHENTICATION REQUIRED ]{TerminalStyle.RESET}\n")
+        print(f"\n{_RED}[ AUTHENTICATION REQUIRED ]{_RESET}\n")
         
         # Draw login form
-        print(f"{TerminalStyle.GREEN} > Username : {TerminalStyle.RESET}", end="")
+        print(f"{_GREEN} > Username : {_RESET}", end="")
         username = input("")
         
-        print(f"{TerminalStyle.GREEN} > Password : {TerminalStyle.RESET}", end="")
+        print(f"{_GREEN} > Password : {_RESET}", end="")
         password = getpass.getpass("")  # Hidden password input
         
         # Authentication simulation
-        print(f"\n{TerminalStyle.BLUE}─" * 65 + f"{TerminalStyle.RESET}")
-        print(f"{TerminalStyle.CYAN}  STATUS : Secure channel initialized{TerminalStyle.RESET}")
-        print(f"{TerminalStyle.CYAN}  ENGINE : Foundation-Core v0.1.0{TerminalStyle.RESET}")
-        print(f"{TerminalStyle.CYAN}  MODE   : Operator Login{TerminalStyle.RESET}")
+        print(f"\n{_BLUE}─" * 65 + f"{_RESET}")
+        print(f"{_CYAN}  STATUS : Secure channel initialized{_RESET}")
+        print(f"{_CYAN}  ENGINE : Foundation-Core v0.1.0{_RESET}")
+        print(f"{_CYAN}  MODE   : Operator Login{_RESET}")
         print()
-        print(f"{TerminalStyle.YELLOW}  NOTE :{TerminalStyle.RESET}")
-        print(f"{TerminalStyle.YELLOW}    - Pastikan kredensial benar.{TerminalStyle.RESET}")
-        print(f"{TerminalStyle.YELLOW}    - Akses ini akan dicatat dalam event-log.{TerminalStyle.RESET}")
-        print(f"{TerminalStyle.YELLOW}    - Sistem menggunakan sandbox & policy isolation.{TerminalStyle.RESET}")
-        print(f"{TerminalStyle.BLUE}─" * 65 + f"{TerminalStyle.RESET}")
+        print(f"{_YELLOW}  NOTE :{_RESET}")
+        print(f"{_YELLOW}    - Pastikan kredensial benar.{_RESET}")
+        print(f"{_YELLOW}    - Akses ini akan dicatat dalam event-log.{_RESET}")
+        print(f"{_YELLOW}    - Sistem menggunakan sandbox & policy isolation.{_RESET}")
+        print(f"{_BLUE}─" * 65 + f"{_RESET}")
         
-        print(f"\n{TerminalStyle.GREEN}   Tekan ENTER untuk memulai sesi operasional...{TerminalStyle.RESET}")
+        print(f"\n{_GREEN}   Tekan ENTER untuk memulai sesi operasional...{_RESET}")
         input()  # Wait for user to press Enter
         
         # Simulate authentication
-        print(f"{TerminalStyle.CYAN}Authenticating...{TerminalStyle.RESET}")
-        time.sleep(1)
+        print(f"{_CYAN}Authenticating...{_RESET}")
+        self._delay(1)
 
-        # Use environment variables or default values
-        admin_username = os.getenv("ADMIN_USERNAME", "admin")
-        admin_password = os.getenv("ADMIN_PASSWORD", "citadel")
+        # Compare both fields in constant time so timing reveals neither
+        user_ok = hmac.compare_digest(username.encode(), _ADMIN_USER)
+        pass_ok = hmac.compare_digest(password.encode(), _ADMIN_PASS)
 
-        if username == admin_username and password == admin_password:
+        if user_ok and pass_ok:
             self.current_user = username
             self.session_active = True
-            print(f"{TerminalStyle.GREEN}✓ Authentication successful!{TerminalStyle.RESET}")
-            time.sleep(1)
-            self.display_dashboard()
+            print(f"{_GREEN}✓ Authentication successful!{_RESET}")
+            self._delay(1)
+            return Screen.DASHBOARD
         else:
-            print(f"{TerminalStyle.RED}✗ Authentication failed. Please try again.{TerminalStyle.RESET}")
-            time.sleep(2)
-            self.print_login_screen()
+            print(f"{_RED}✗ Authentication failed. Please try again.{_RESET}")
+            # Hold the error on screen; the login screen clears it on redraw
+            input(f"{_YELLOW}Press ENTER to try again...{_RESET}")
+            return Screen.LOGIN
     
     def display_dashboard(self):
-        """Display the main dashboard"""
+        """Display the main dashboard and return the next screen"""
         self.clear_screen()
-        self.print_header("CITADEL-AGENT DASHBOARD", "Secure Automation Suite")
+        # Collect the whole screen and emit it with a single write
+        out = self.header_lines("CITADEL-AGENT DASHBOARD", "Secure Automation Suite")
         
         # User info box
         user_info = [
@@ -136,12 +247,9 @@ class CitadelTerminal:
             f"STATUS   : Active | Last Activity: 0s ago"
         ]
         
-        print(f"{TerminalStyle.PURPLE}╔{'═' * 63}╗{TerminalStyle.RESET}")
-        print(f"{TerminalStyle.PURPLE}║{TerminalStyle.CYAN}{user_info[0]:<63}{TerminalStyle.PURPLE}║{TerminalStyle.RESET}")
-        print(f"{TerminalStyle.PURPLE}║{TerminalStyle.CYAN}{user_info[1]:<63}{TerminalStyle.PURPLE}║{TerminalStyle.RESET}")
-        print(f"{TerminalStyle.PURPLE}║{TerminalStyle.CYAN}{user_info[2]:<63}{TerminalStyle.PURPLE}║{TerminalStyle.RESET}")
-        print(f"{TerminalStyle.PURPLE}║{TerminalStyle.CYAN}{user_info[3]:<63}{TerminalStyle.PURPLE}║{TerminalStyle.RESET}")
-        print(f"{TerminalStyle.PURPLE}╚{'═' * 63}╝{TerminalStyle.RESET}")
+        out.append(_USER_TOP)
+        out.extend(_USER_ROW.format(line.ljust(63)) for line in user_info)
+        out.append(_USER_BOTTOM)
         
         # Active Workflows
         workflows = [
@@ -151,117 +259,77 @@ class CitadelTerminal:
             "[QUEUED]  Email Campaign          ░░░░░░░░░░░░    0%"
         ]
         
-        wf_lines = [f"{TerminalStyle.GREEN}┌─ ACTIVE WORKFLOWS ─────────────────────────────────────┐{TerminalStyle.RESET}"]
-        for wf in workflows:
-            wf_lines.append(f"{TerminalStyle.GREEN}│{TerminalStyle.RESET} {wf:<59} {TerminalStyle.GREEN}│{TerminalStyle.RESET}")
-        wf_lines.append(f"{TerminalStyle.GREEN}└─────────────────────────────────────────────────────────┘{TerminalStyle.RESET}")
-        
-        for line in wf_lines:
-            print(line)
+        out.append(f"{_GREEN}┌─ ACTIVE WORKFLOWS ─────────────────────────────────────┐{_RESET}")
+        out.extend(_WORKFLOW_ROW.format(wf.ljust(59)) for wf in workflows)
+        out.append(f"{_GREEN}└─────────────────────────────────────────────────────────┘{_RESET}")
         
         # System Metrics
-        cpu_bar = "█" * int(self.system_metrics['cpu']/10) + "░" * (10 - int(self.system_metrics['cpu']/10))
-        ram_bar = "█" * int(self.system_metrics['ram']/10) + "░" * (10 - int(self.system_metrics['ram']/10))
-        
-        metrics_lines = [
-            f"{TerminalStyle.BLUE}┌─ SYSTEM METRICS ───────────────────────────────────────┐{TerminalStyle.RESET}",
-            f"{TerminalStyle.BLUE}│{TerminalStyle.RESET} CPU: {cpu_bar} {self.system_metrics['cpu']:>2}% | RAM: {ram_bar} {self.system_metrics['ram']:>2}% {TerminalStyle.BLUE}│{TerminalStyle.RESET}",
-            f"{TerminalStyle.BLUE}│{TerminalStyle.RESET} Nodes: {self.system_metrics['nodes']} Active | Sessions: {self.system_metrics['sessions']} | Queued: {self.system_metrics['queued']} {TerminalStyle.BLUE}│{TerminalStyle.RESET}",
-            f"{TerminalStyle.BLUE}│{TerminalStyle.RESET} Security: [{TerminalStyle.GREEN}✓{TerminalStyle.RESET}] Active | Sandboxed: [{TerminalStyle.GREEN}✓{TerminalStyle.RESET}] Active {TerminalStyle.BLUE}│{TerminalStyle.RESET}",
-            f"{TerminalStyle.BLUE}└─────────────────────────────────────────────────────────┘{TerminalStyle.RESET}"
-        ]
+        cpu_bar = _BAR10[self.system_metrics['cpu'] // 10]
+        ram_bar = _BAR10[self.system_metrics['ram'] // 10]
         
-        for line in metrics_lines:
-            print(line)
+        out.extend([
+            f"{_BLUE}┌─ SYSTEM METRICS ───────────────────────────────────────┐{_RESET}",
+            f"{_BLUE_EDGE} CPU: {cpu_bar} {self.system_metrics['cpu']:>2}% | RAM: {ram_bar} {self.system_metrics['ram']:>2}% {_BLUE_EDGE}",
+            f"{_BLUE_EDGE} Nodes: {self.system_metrics['nodes']} Active | Sessions: {self.system_metrics['sessions']} | Queued: {self.system_metrics['queued']} {_BLUE_EDGE}",
+            f"{_BLUE_EDGE} Security: [{_GREEN}✓{_RESET}] Active | Sandboxed: [{_GREEN}✓{_RESET}] Active {_BLUE_EDGE}",
+            f"{_BLUE}└─────────────────────────────────────────────────────────┘{_RESET}"
+        ])
         
         # Quick Actions
-        actions = [
-            f"[1] Create Workflow  [4] View Logs      [7] Settings",
-            f"[2] Monitor Execs    [5] Manage Nodes   [8] Security",
-            f"[3] Schedule Task    [6] System Status  [9] Profile "
-        ]
-        
-        action_lines = [
-            f"{TerminalStyle.YELLOW}┌─ QUICK ACTIONS ────────────────────────────────────────┐{TerminalStyle.RESET}",
-            f"{TerminalStyle.YELLOW}│{TerminalStyle.RESET} {actions[0]:<59} {TerminalStyle.YELLOW}│{TerminalStyle.RESET}",
-            f"{TerminalStyle.YELLOW}│{TerminalStyle.RESET} {actions[1]:<59} {TerminalStyle.YELLOW}│{TerminalStyle.RESET}",
-            f"{TerminalStyle.YELLOW}│{TerminalStyle.RESET} {actions[2]:<59} {TerminalStyle.YELLOW}│{TerminalStyle.RESET}",
-            f"{TerminalStyle.YELLOW}└─────────────────────────────────────────────────────────┘{TerminalStyle.RESET}"
-        ]
+        out.extend(_QUICK_ACTION_LINES)
         
-        for line in action_lines:
-            print(line)
-        
-        print(f"\n{TerminalStyle.CYAN}Press [CMD] for console access | [ESC] for menu | [H] for help{TerminalStyle.RESET}")
+        out.append(f"\n{_CYAN}Press [CMD] for console access | [ESC] for menu | [H] for help{_RESET}")
+        sys.stdout.write("\n".join(out) + "\n")
+        sys.stdout.flush()
         
         # Handle user input
-        cmd = input(f"\n{TerminalStyle.GREEN}[CMD]{TerminalStyle.RESET}> ").lower()
+        cmd = input(f"\n{_GREEN}[CMD]{_RESET}> ").lower()
         if cmd == "h":
-            self.show_help()
+            return Screen.HELP
         elif cmd == "esc":
             print("Returning to menu...")
-            time.sleep(1)
-            self.print_login_screen()
+            self._delay(1)
+            return Screen.LOGIN
         elif cmd == "quit" or cmd == "exit":
-            print(f"{TerminalStyle.RED}Shutting down Citadel Agent...{TerminalStyle.RESET}")
-            sys.exit(0)
+            print(f"{_RED}Shutting down Citadel Agent...{_RESET}")
+            return Screen.EXIT
         else:
-            print(f"{TerminalStyle.YELLOW}Command '{cmd}' not recognized. Press 'H' for help.{TerminalStyle.RESET}")
-            time.sleep(2)
-            self.display_dashboard()
+            print(f"{_YELLOW}Command '{cmd}' not recognized. Press 'H' for help.{_RESET}")
+            input(f"{_YELLOW}Press ENTER to continue...{_RESET}")
+            return Screen.DASHBOARD
     
     def show_help(self):
-        """Show help information"""
+        """Show help information and return to the dashboard"""
         self.clear_screen()
         self.print_header("CITADEL-AGENT HELP", "Command Reference")
         
-        help_text = [
-            "",
-            f"{TerminalStyle.BOLD}AVAILABLE COMMANDS:{TerminalStyle.RESET}",
-            "",
-            "  dashboard     - Return to main dashboard",
-            "  workflow      - Manage workflows (create, run, monitor)",
-            "  nodes         - View and manage nodes",
-            "  monitor       - Monitor system performance",
-            "  security      - View security status and logs",
-            "  settings      - Modify user settings",
-            "",
-            f"{TerminalStyle.BOLD}QUICK ACCESS KEYS:{TerminalStyle.RESET}",
-            "",
-            "  [H]         - Show this help",
-            "  [ESC]       - Return to login",
-            "  [CMD]       - Access console",
-            "",
-            f"{TerminalStyle.BOLD}SYSTEM INFORMATION:{TerminalStyle.RESET}",
-            "",
-            "  Version: 0.1.0",
-            "  Engine: Foundation-Core v0.1.0",
-            "  Build: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            "",
-            f"Press ENTER to return to dashboard..."
-        ]
-        
-        for line in help_text:
-            print(line)
+        print(_HELP_TEXT_TEMPLATE % datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
         
         input()
-        self.display_dashboard()
+        return Screen.DASHBOARD
     
     def run(self):
         """Main application loop"""
+        handlers = {
+            Screen.LOGIN: self.print_login_screen,
+            Screen.DASHBOARD: self.display_dashboard,
+            Screen.HELP: self.show_help,
+        }
         try:
-            self.print_login_screen()
+            # Each handler returns the next screen instead of calling it
+            while self.state is not Screen.EXIT:
+                self.state = handlers[self.state]()
         except KeyboardInterrupt:
-            print(f"\n\n{TerminalStyle.RED}Shutting down Citadel Agent...{TerminalStyle.RESET}")
+            print(f"\n\n{_RED}Shutting down Citadel Agent...{_RESET}")
             sys.exit(0)
 
 
 def main():
     """Main entry point"""
-    print(f"{TerminalStyle.CYAN}Starting Citadel-Agent v0.1.0...{TerminalStyle.RESET}")
-    time.sleep(1)
-    
+    print(f"{_CYAN}Starting Citadel-Agent v0.1.0...{_RESET}")
     app = CitadelTerminal()
+    app._delay(1)
+    
     app.run()
 
 